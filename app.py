@@ -1,13 +1,18 @@
 # app.py
 from collections import defaultdict
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 from urllib.parse import urlparse
+import atexit
+import base64
+import json
 import os
 
 import config
 from crawler import WebCrawler
+from suggester import QuerySuggester
 
 crawler_instance = None  # Inisialisasi crawler_instance global sebagai None
+suggester_instance = QuerySuggester()
 
 def get_user_choice_for_cache():
     # Kode ini tetap sama seperti yang Anda sediakan
@@ -56,6 +61,58 @@ def get_crawl_strategy_from_input():
         else:
             print("Pilihan tidak valid. Ulangi.")
 
+def encode_search_cursor(keyword, position, snapshot_id):
+    # Cursor menyimpan posisi dokumen berikutnya yang akan dievaluasi pada snapshot data
+    payload = json.dumps({'q': keyword, 'p': position, 's': snapshot_id}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def decode_search_cursor(cursor, keyword, snapshot_id, snapshot_size):
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+        position = int(payload['p'])
+    except (ValueError, KeyError, TypeError, AttributeError):
+        raise ValueError("Cursor tidak valid.")
+    if payload.get('q') != keyword or payload.get('s') != snapshot_id or not 0 <= position < snapshot_size:
+        raise ValueError("Cursor tidak cocok dengan kata kunci atau data sudah berubah. Ulangi pencarian tanpa cursor.")
+    return position
+
+
+def parse_api_search_params(keyword, limit, cursor, snapshot_id, snapshot_size):
+    keyword = keyword.strip() if isinstance(keyword, str) else ''
+    if not keyword:
+        raise ValueError("Kata kunci tidak boleh kosong.")
+    if limit is None or limit == '':
+        limit = config.SEARCH_RESULT_LIMIT
+    else:
+        # Hanya int asli (bukan bool/float dari body JSON) atau string digit dari query string
+        if isinstance(limit, str) and limit.strip().isascii() and limit.strip().isdigit():
+            limit = int(limit)
+        elif isinstance(limit, bool) or not isinstance(limit, int):
+            raise ValueError("Parameter limit harus berupa bilangan bulat.")
+        if not 1 <= limit <= config.API_SEARCH_MAX_LIMIT:
+            raise ValueError(f"Parameter limit harus antara 1 dan {config.API_SEARCH_MAX_LIMIT}.")
+    start = decode_search_cursor(cursor, keyword, snapshot_id, snapshot_size) if cursor else 0
+    return keyword, limit, start
+
+
+def stream_search_page(crawler, keyword, limit, start, snapshot_id, snapshot, record_query=False):
+    # Hasil dikirim satu per satu sebagai potongan JSON agar respons besar tidak perlu dibangun utuh di memori
+    yield '{"keyword": %s, "results": [' % json.dumps(keyword)
+    count = 0
+    next_cursor = None
+    for position, result in crawler.iter_search(keyword, start=start, snapshot=snapshot):
+        if count >= limit:
+            # Masih ada hasil setelah halaman penuh; halaman berikutnya dimulai tepat dari dokumen ini
+            next_cursor = encode_search_cursor(keyword, position, snapshot_id)
+            break
+        yield (', ' if count else '') + json.dumps(result)
+        count += 1
+    if record_query and count:
+        suggester_instance.record_query(keyword)
+    yield '], "count": %d, "next_cursor": %s}' % (count, json.dumps(next_cursor))
+
+
 def create_app(perform_initial_crawl_flag):
     global crawler_instance # Menyatakan penggunaan instance global
 
@@ -101,6 +158,12 @@ def create_app(perform_initial_crawl_flag):
         else:
             print("Tidak ada data cache yang dimuat dan tidak ada crawling yang dijalankan. Pencarian mungkin tidak menghasilkan apa-apa.")
 
+    # Indeks saran dibangun sekali dari data hasil crawling agar /suggest tidak perlu memindai crawled_data
+    suggester_instance.build(crawler_instance.crawled_data)
+    # Riwayat query dipertahankan antar restart agar bobot frekuensi query tidak hilang
+    suggester_instance.load_query_log()
+    atexit.register(suggester_instance.save_query_log)
+
     @app.route('/')
     def index():
         current_seed_url = config.SEED_URL
@@ -124,8 +187,72 @@ def create_app(perform_initial_crawl_flag):
              return render_template('index.html', keyword=keyword, results=[], error="Data belum di-crawl atau tidak ada data di cache. Silakan jalankan crawling terlebih dahulu.", SEED_URL=current_seed_url)
 
         results = crawler_instance.search(keyword, limit=config.SEARCH_RESULT_LIMIT)
+        if results:
+            suggester_instance.record_query(keyword)
         return render_template('index.html', keyword=keyword, results=results, SEED_URL=current_seed_url)
 
+    @app.route('/api/search')
+    def api_search():
+        global crawler_instance
+        if crawler_instance is None or not crawler_instance.crawled_data:
+            return jsonify({'error': 'Data belum di-crawl atau tidak ada data di cache.'}), 503
+
+        snapshot_id, snapshot = crawler_instance.get_search_snapshot()
+        try:
+            keyword, limit, start = parse_api_search_params(
+                request.args.get('q'), request.args.get('limit'), request.args.get('cursor'), snapshot_id, len(snapshot)
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        return Response(stream_with_context(stream_search_page(crawler_instance, keyword, limit, start, snapshot_id, snapshot,
+                                                               record_query=(start == 0))),
+                        mimetype='application/json')
+
+    @app.route('/api/search/batch', methods=['POST'])
+    def api_search_batch():
+        global crawler_instance
+        if crawler_instance is None or not crawler_instance.crawled_data:
+            return jsonify({'error': 'Data belum di-crawl atau tidak ada data di cache.'}), 503
+
+        payload = request.get_json(silent=True)
+        queries = payload.get('queries') if isinstance(payload, dict) else None
+        if not isinstance(queries, list) or not queries:
+            return jsonify({'error': 'Body JSON harus berisi daftar "queries" yang tidak kosong.'}), 400
+        if len(queries) > config.API_BATCH_MAX_QUERIES:
+            return jsonify({'error': f'Maksimal {config.API_BATCH_MAX_QUERIES} query per batch.'}), 400
+
+        # Semua query dievaluasi terhadap satu snapshot yang sama
+        snapshot_id, snapshot = crawler_instance.get_search_snapshot()
+        crawler = crawler_instance
+
+        def generate():
+            yield '{"responses": ['
+            for idx, query in enumerate(queries):
+                if idx:
+                    yield ', '
+                if isinstance(query, str):
+                    query = {'q': query}
+                if not isinstance(query, dict):
+                    yield json.dumps({'error': 'Setiap query harus berupa string atau objek.'})
+                    continue
+                try:
+                    keyword, limit, start = parse_api_search_params(
+                        query.get('q'), query.get('limit'), query.get('cursor'), snapshot_id, len(snapshot)
+                    )
+                except ValueError as e:
+                    yield json.dumps({'keyword': query.get('q'), 'error': str(e)})
+                    continue
+                yield from stream_search_page(crawler, keyword, limit, start, snapshot_id, snapshot)
+            yield ']}'
+
+        return Response(stream_with_context(generate()), mimetype='application/json')
+
+    @app.route('/suggest')
+    def suggest():
+        text = request.args.get('q', '')
+        return jsonify({'query': text, 'suggestions': suggester_instance.suggest(text)})
+
     @app.route('/get_link_path')
     def get_link_path():
         global crawler_instance
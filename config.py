@@ -6,7 +6,21 @@ MAX_DEPTH = 2
 
 SEARCH_RESULT_LIMIT = 30
 
+# Batas untuk endpoint JSON /api/search dan /api/search/batch
+API_SEARCH_MAX_LIMIT = 100
+API_BATCH_MAX_QUERIES = 50
+
+# Autocomplete /suggest
+SUGGEST_TOP_K = 8
+SUGGEST_PRECOMPUTE_PREFIX_LEN = 3  # Prefix sepanjang ini atau lebih pendek memakai top-k yang dihitung saat indexing
+SUGGEST_QUERY_WEIGHT = 5  # Bobot tiap pencarian sebelumnya relatif terhadap satu dokumen (document frequency)
+SUGGEST_MAX_QUERY_LENGTH = 100  # Query lebih panjang dari ini tidak dicatat
+SUGGEST_MAX_STORED_QUERIES = 5000  # Query paling jarang dibuang jika jumlah query tersimpan melebihi batas ini
+SUGGEST_QUERY_SCAN_LIMIT = 200  # Maksimal query yang diperiksa untuk prefix panjang
+SUGGEST_SAVE_EVERY = 20  # Riwayat query disimpan ke disk setiap sekian query baru dicatat
+
 CACHE_DIR = "cache_data"
 parsed_seed_url = SEED_URL.replace("https://", "").replace("http://", "").replace("/", "_")
 CACHE_FILENAME = f"crawled_data_{parsed_seed_url}_depth{MAX_DEPTH}.pkl"
-CACHE_FILE_PATH = os.path.join(CACHE_DIR, CACHE_FILENAME)
\ No newline at end of file
+CACHE_FILE_PATH = os.path.join(CACHE_DIR, CACHE_FILENAME)
+QUERY_LOG_FILE_PATH = os.path.join(CACHE_DIR, "query_log.pkl")
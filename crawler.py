@@ -5,6 +5,7 @@ from bs4 import BeautifulSoup #
 from urllib.parse import urlparse, urljoin #
 from collections import deque, defaultdict #
 import time #
+import hashlib
 import re #
 import os #
 import pickle #
@@ -16,6 +17,8 @@ class WebCrawler:
         self.base_domain = base_domain #
         self.visited_urls = set() #
         self.crawled_data = {} #
+        self.data_generation = 0 # Dinaikkan setiap kali crawled_data berubah
+        self._search_snapshot_cache = None # (data_generation, snapshot_id, snapshot)
         self.headers = { #
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
@@ -58,6 +61,7 @@ class WebCrawler:
                 with open(config.CACHE_FILE_PATH, 'rb') as f: #
                     cache_content = pickle.load(f) #
                     self.crawled_data = cache_content.get('crawled_data', {}) #
+                    self.data_generation += 1 #
                     self.visited_urls = cache_content.get('visited_urls', set()) #
                     loaded_stats = cache_content.get('stats', {}) #
                     self.stats.update(loaded_stats) #
@@ -162,6 +166,7 @@ class WebCrawler:
         }
         self.visited_urls = set() #
         self.crawled_data = {} #
+        self.data_generation += 1 #
 
 
     def crawl_bfs(self): #
@@ -230,6 +235,7 @@ class WebCrawler:
                     'title': title, 'content': content, 'parent_url': parent_url,
                     'path_info': current_path_info, 'depth': current_depth, 'is_html': is_html
                 }
+                self.data_generation += 1 #
                 self.visited_urls.add(current_url) #
                 crawled_count_session += 1 #
                 self.stats["pages_per_depth"][current_depth] += 1 #
@@ -357,6 +363,7 @@ class WebCrawler:
                 'title': title, 'content': content, 'parent_url': parent_url,
                 'path_info': current_path_info, 'depth': current_depth, 'is_html': is_html
             }
+            self.data_generation += 1 #
             self.visited_urls.add(current_url) #
             crawled_count_session += 1 #
             self.stats["pages_per_depth"][current_depth] += 1 #
@@ -417,51 +424,75 @@ class WebCrawler:
             if data_item.get('depth', 0) > max_d: max_d = data_item['depth'] #
         return max_d
 
+    def get_search_snapshot(self): #
+        # Salinan (url, data) yang urutannya stabil; posisi pada list ini dipakai sebagai cursor paginasi.
+        # Snapshot hanya dibangun ulang jika crawled_data berubah, dan snapshot_id (hash urutan URL)
+        # memastikan cursor lama tidak dipakai pada urutan dokumen yang berbeda, termasuk setelah restart.
+        cached = self._search_snapshot_cache #
+        if cached is None or cached[0] != self.data_generation: #
+            snapshot = list(self.crawled_data.items()) #
+            snapshot_id = hashlib.sha1('\n'.join(url for url, _ in snapshot).encode('utf-8')).hexdigest()[:16] #
+            cached = (self.data_generation, snapshot_id, snapshot) #
+            self._search_snapshot_cache = cached #
+        return cached[1], cached[2] #
+
+    def _build_search_result(self, url, data, search_terms): #
+        title_text = data.get('title', '') #
+        content_text = data.get('content', '') #
+        if title_text is None: title_text = "" #
+        if content_text is None: content_text = "" #
+        title_text_lower = title_text.lower() #
+        match_in_title = all(term in title_text_lower for term in search_terms) #
+        match_in_content = False #
+        if content_text: #
+             content_text_lower = content_text.lower() #
+             match_in_content = all(term in content_text_lower for term in search_terms) #
+        if not (match_in_title or match_in_content): return None #
+        snippet = "" #
+        if content_text and match_in_content: #
+            first_term_in_content_index = -1 #
+            current_search_term_for_snippet = "" #
+            for term_idx, term in enumerate(search_terms): #
+                try:
+                    idx = content_text_lower.index(term) #
+                    if first_term_in_content_index == -1 or idx < first_term_in_content_index: #
+                        first_term_in_content_index = idx #
+                        current_search_term_for_snippet = term #
+                except ValueError:
+                    if term_idx == len(search_terms) -1 and first_term_in_content_index == -1: #
+                        snippet = content_text[:200] + ('...' if len(content_text) > 200 else '') #
+                        break
+                    continue #
+            else:
+                if first_term_in_content_index != -1: #
+                    start_index = first_term_in_content_index #
+                    snippet_start = max(0, start_index - 70) #
+                    snippet_end = min(len(content_text), start_index + len(current_search_term_for_snippet) + 130) #
+                    prefix = "..." if snippet_start > 0 else ""; suffix = "..." if snippet_end < len(content_text) else "" #
+                    snippet = prefix + content_text[snippet_start:snippet_end] + suffix #
+                elif content_text: snippet = content_text[:200] + ('...' if len(content_text) > 200 else '') #
+        elif match_in_title: #
+            if not content_text: snippet = f"Judul '{title_text}' cocok. Konten tidak tersedia atau tidak relevan." #
+            else: snippet = f"Judul '{title_text}' cocok. Pratinjau konten: " + (content_text[:150] + ('...' if len(content_text) > 150 else '')) #
+        elif not content_text and not match_in_title: snippet = "Informasi tidak cukup untuk menampilkan snippet." #
+        return {'url': url, 'title': title_text, 'snippet': snippet.strip(), 'path_info': data.get('path_info', []) } #
+
+    def iter_search(self, keyword, start=0, snapshot=None): #
+        # Menghasilkan (posisi, hasil) secara lazy mulai dari posisi `start` pada snapshot,
+        # sehingga halaman berikutnya bisa melanjutkan evaluasi tanpa mengulang dari awal.
+        if snapshot is None: _, snapshot = self.get_search_snapshot() #
+        search_terms = keyword.lower().split() #
+        for position in range(start, len(snapshot)): #
+            url, data = snapshot[position] #
+            result = self._build_search_result(url, data, search_terms) #
+            if result is not None: #
+                yield position, result #
+
     def search(self, keyword, limit): #
         results = [] #
-        keyword_lower = keyword.lower() #
-        search_terms = keyword_lower.split() #
-        for url, data in self.crawled_data.items(): #
-            title_text = data.get('title', '') #
-            content_text = data.get('content', '') #
-            if title_text is None: title_text = "" #
-            if content_text is None: content_text = "" #
-            title_text_lower = title_text.lower() #
-            match_in_title = all(term in title_text_lower for term in search_terms) #
-            match_in_content = False #
-            if content_text: #
-                 content_text_lower = content_text.lower() #
-                 match_in_content = all(term in content_text_lower for term in search_terms) #
-            if match_in_title or match_in_content: #
-                snippet = "" #
-                if content_text and match_in_content: #
-                    first_term_in_content_index = -1 #
-                    current_search_term_for_snippet = "" #
-                    for term_idx, term in enumerate(search_terms): #
-                        try:
-                            idx = content_text_lower.index(term) #
-                            if first_term_in_content_index == -1 or idx < first_term_in_content_index: #
-                                first_term_in_content_index = idx #
-                                current_search_term_for_snippet = term #
-                        except ValueError:
-                            if term_idx == len(search_terms) -1 and first_term_in_content_index == -1: #
-                                snippet = content_text[:200] + ('...' if len(content_text) > 200 else '') #
-                                break
-                            continue #
-                    else:
-                        if first_term_in_content_index != -1: #
-                            start_index = first_term_in_content_index #
-                            snippet_start = max(0, start_index - 70) #
-                            snippet_end = min(len(content_text), start_index + len(current_search_term_for_snippet) + 130) #
-                            prefix = "..." if snippet_start > 0 else ""; suffix = "..." if snippet_end < len(content_text) else "" #
-                            snippet = prefix + content_text[snippet_start:snippet_end] + suffix #
-                        elif content_text: snippet = content_text[:200] + ('...' if len(content_text) > 200 else '') #
-                elif match_in_title: #
-                    if not content_text: snippet = f"Judul '{title_text}' cocok. Konten tidak tersedia atau tidak relevan." #
-                    else: snippet = f"Judul '{title_text}' cocok. Pratinjau konten: " + (content_text[:150] + ('...' if len(content_text) > 150 else '')) #
-                elif not content_text and not match_in_title: snippet = "Informasi tidak cukup untuk menampilkan snippet." #
-                results.append({'url': url, 'title': title_text, 'snippet': snippet.strip(), 'path_info': data.get('path_info', []) }) #
-                if len(results) >= limit: break #
+        for _, result in self.iter_search(keyword): #
+            results.append(result) #
+            if len(results) >= limit: break #
         return results #
 
     def get_path_details(self, target_url): #
@@ -0,0 +1,205 @@
+# suggester.py
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+import heapq
+import os
+import pickle
+import re
+import tempfile
+import threading
+import config
+
+TOKEN_PATTERN = re.compile(r'\w{2,}')
+MAX_TERM_LENGTH = 40
+
+class QuerySuggester:
+    def __init__(self, top_k=config.SUGGEST_TOP_K, precompute_prefix_len=config.SUGGEST_PRECOMPUTE_PREFIX_LEN):
+        self.top_k = top_k
+        self.precompute_prefix_len = precompute_prefix_len
+        self.terms = []                 # Vocabulary terurut untuk pencarian prefix dengan bisect
+        self.doc_freq = {}              # term -> jumlah dokumen yang memuat term tersebut
+        self.top_by_prefix = {}         # prefix pendek -> tuple top-k term (dihitung saat indexing)
+        self.query_counts = Counter()   # query yang pernah dicari (dan memberi hasil) -> frekuensi
+        self.query_keys = []            # Kunci query_counts yang terurut
+        self.query_top_by_prefix = {}   # prefix pendek -> list top-k query, diperbarui di record_query
+        self.query_last_seen = {}       # query -> nilai _query_clock saat terakhir dicatat
+        self._query_clock = 0
+        self._unsaved_records = 0
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # Hanya satu thread yang menulis file riwayat query pada satu waktu
+
+    @staticmethod
+    def normalize(text):
+        return ' '.join(text.lower().split()) if text else ''
+
+    def build(self, crawled_data):
+        doc_freq = Counter()
+        for data in crawled_data.values():
+            text = f"{data.get('title') or ''} {data.get('content') or ''}".lower()
+            doc_freq.update({term for term in TOKEN_PATTERN.findall(text) if len(term) <= MAX_TERM_LENGTH})
+
+        # Untuk prefix pendek, rentang term yang cocok bisa sangat besar, jadi top-k-nya dihitung sekali di sini
+        top_by_prefix = self._top_k_by_prefix(doc_freq)
+
+        self.terms = sorted(doc_freq)
+        self.doc_freq = dict(doc_freq)
+        self.top_by_prefix = top_by_prefix
+        print(f"Indeks saran dibangun: {len(self.terms)} term, {len(self.top_by_prefix)} prefix dihitung awal.")
+
+    def _top_k_by_prefix(self, scores):
+        candidates_by_prefix = defaultdict(list)
+        for key in scores:
+            for length in range(1, min(len(key), self.precompute_prefix_len) + 1):
+                candidates_by_prefix[key[:length]].append(key)
+        return {
+            prefix: heapq.nsmallest(self.top_k, candidates, key=lambda k: (-scores[k], k))
+            for prefix, candidates in candidates_by_prefix.items()
+        }
+
+    @staticmethod
+    def _prefix_range(sorted_keys, prefix, max_items=None):
+        start = bisect_left(sorted_keys, prefix)
+        end = bisect_left(sorted_keys, prefix + '\uffff', start)
+        if max_items is not None:
+            end = min(end, start + max_items)
+        return sorted_keys[start:end]
+
+    def _rebuild_query_index(self):
+        self.query_keys = sorted(self.query_counts)
+        self.query_top_by_prefix = self._top_k_by_prefix(self.query_counts)
+
+    def _retain_queries(self, query_counts, query_last_seen, keep, keep_query=None):
+        # Peringkat berdasarkan frekuensi lalu waktu terakhir dicari, sehingga pada frekuensi yang sama
+        # query yang lebih baru menang atas query lama
+        ranked = heapq.nlargest(keep, query_counts, key=lambda q: (query_counts[q], query_last_seen.get(q, 0)))
+        if keep_query is not None and keep_query not in ranked:
+            ranked[-1] = keep_query
+        return ranked
+
+    def _evict_queries(self, keep_query):
+        # Buang query paling jarang sekaligus dalam satu batch agar biaya rebuild jarang terjadi.
+        # Semua frekuensi juga dibagi dua (penuaan) agar query lama yang dulu populer tidak bertahan selamanya.
+        keep = config.SUGGEST_MAX_STORED_QUERIES * 9 // 10
+        ranked = self._retain_queries(self.query_counts, self.query_last_seen, keep, keep_query)
+        self.query_counts = Counter({q: max(1, self.query_counts[q] // 2) for q in ranked})
+        self.query_last_seen = {q: self.query_last_seen.get(q, 0) for q in ranked}
+        self._rebuild_query_index()
+
+    def load_query_log(self):
+        if not os.path.exists(config.QUERY_LOG_FILE_PATH):
+            return False
+        try:
+            with open(config.QUERY_LOG_FILE_PATH, 'rb') as f:
+                loaded = pickle.load(f)
+            loaded_counts = loaded.get('query_counts', {})
+            loaded_last_seen = loaded.get('query_last_seen', {})
+            query_counts = Counter({
+                query: count for query, count in loaded_counts.items()
+                if isinstance(query, str) and query and len(query) <= config.SUGGEST_MAX_QUERY_LENGTH
+                and isinstance(count, int) and not isinstance(count, bool) and count > 0
+            })
+            query_last_seen = {
+                query: stamp for query, stamp in loaded_last_seen.items()
+                if query in query_counts and isinstance(stamp, int) and not isinstance(stamp, bool)
+            }
+            ranked = self._retain_queries(query_counts, query_last_seen, config.SUGGEST_MAX_STORED_QUERIES)
+            with self._lock:
+                self.query_counts = Counter({q: query_counts[q] for q in ranked})
+                self.query_last_seen = {q: query_last_seen.get(q, 0) for q in ranked}
+                self._query_clock = max(self.query_last_seen.values(), default=0)
+                self._rebuild_query_index()
+            print(f"Riwayat query dimuat dari: {config.QUERY_LOG_FILE_PATH} ({len(self.query_counts)} query)")
+            return True
+        except Exception as e:
+            print(f"Error saat memuat riwayat query: {e}")
+            return False
+
+    def save_query_log(self):
+        # Data diambil di dalam _save_lock agar penyimpanan yang selesai terakhir juga membawa data terbaru
+        with self._save_lock:
+            with self._lock:
+                data_to_save = {
+                    'query_counts': dict(self.query_counts),
+                    'query_last_seen': dict(self.query_last_seen)
+                }
+                self._unsaved_records = 0
+            temp_path = None
+            try:
+                os.makedirs(config.CACHE_DIR, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=config.CACHE_DIR, prefix='query_log.', suffix='.tmp')
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(data_to_save, f)
+                os.replace(temp_path, config.QUERY_LOG_FILE_PATH)  # Ganti file secara atomik agar tidak rusak jika proses berhenti
+            except Exception as e:
+                print(f"Error saat menyimpan riwayat query: {e}")
+                if temp_path and os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+    def record_query(self, keyword):
+        # Dipanggil hanya untuk pencarian yang memberi hasil, agar typo dan query acak tidak masuk ke saran
+        query = self.normalize(keyword)
+        if not query or len(query) > config.SUGGEST_MAX_QUERY_LENGTH:
+            return
+        with self._lock:
+            if query not in self.query_counts:
+                insort(self.query_keys, query)
+            self.query_counts[query] += 1
+            self._query_clock += 1
+            self.query_last_seen[query] = self._query_clock
+            self._unsaved_records += 1
+            should_save = self._unsaved_records >= config.SUGGEST_SAVE_EVERY
+            if should_save:
+                self._unsaved_records = 0  # Reset di sini agar hanya satu thread yang memicu penyimpanan ini
+
+            if len(self.query_counts) > config.SUGGEST_MAX_STORED_QUERIES:
+                self._evict_queries(keep_query=query)
+            else:
+                for length in range(1, min(len(query), self.precompute_prefix_len) + 1):
+                    top = self.query_top_by_prefix.setdefault(query[:length], [])
+                    if query not in top:
+                        top.append(query)
+                    top.sort(key=lambda q: (-self.query_counts[q], q))
+                    del top[self.top_k:]
+
+        if should_save:
+            self.save_query_log()
+
+    def _terms_with_prefix(self, prefix):
+        if len(prefix) <= self.precompute_prefix_len:
+            return self.top_by_prefix.get(prefix, ())
+        # Prefix panjang hanya mencakup rentang kecil di vocabulary terurut
+        candidates = self._prefix_range(self.terms, prefix)
+        return heapq.nsmallest(self.top_k, candidates, key=lambda t: (-self.doc_freq[t], t))
+
+    def _past_queries_with_prefix(self, prefix):
+        # Pemanggil harus memegang self._lock
+        if len(prefix) <= self.precompute_prefix_len:
+            return list(self.query_top_by_prefix.get(prefix, ()))
+        return self._prefix_range(self.query_keys, prefix, config.SUGGEST_QUERY_SCAN_LIMIT)
+
+    def suggest(self, text, limit=None):
+        limit = limit or self.top_k
+        query = self.normalize(text)
+        if not query:
+            return []
+
+        scores = {}
+        # Lengkapi kata terakhir berdasarkan vocabulary; kata-kata sebelumnya dipertahankan
+        head, _, last = query.rpartition(' ')
+        if not text[-1].isspace():
+            for term in self._terms_with_prefix(last):
+                completion = f"{head} {term}" if head else term
+                scores[completion] = self.doc_freq[term]
+
+        with self._lock:
+            # Spasi di akhir berarti pengguna sudah memulai kata baru, jadi kata terakhir tidak boleh dilengkapi lagi
+            query_prefix = query + ' ' if text[-1].isspace() else query
+            past_queries = [(past, self.query_counts[past]) for past in self._past_queries_with_prefix(query_prefix)]
+            boosts = {completion: self.query_counts.get(completion, 0) for completion in scores}
+
+        for completion, count in boosts.items():
+            scores[completion] += config.SUGGEST_QUERY_WEIGHT * count
+        for past, count in past_queries:
+            scores[past] = max(scores.get(past, 0), self.doc_freq.get(past, 0) + config.SUGGEST_QUERY_WEIGHT * count)
+
+        return heapq.nsmallest(limit, scores, key=lambda s: (-scores[s], s))